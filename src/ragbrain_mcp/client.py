@@ -1,20 +1,85 @@
 """HTTP client for RAGBrain API."""
 
+import asyncio
 import logging
+import time
 from typing import Any
 
 import httpx
+import orjson
 
 from .config import Settings
 
 logger = logging.getLogger("ragbrain-mcp")
 
+# Fixed API endpoint paths, joined with the base URL once per client
+_ENDPOINTS = {
+    "health": "/health",
+    "namespaces": "/api/namespaces",
+    "namespace_tree": "/api/namespaces/tree",
+    "documents": "/api/documents",
+    "documents_bulk": "/api/documents/bulk",
+    "discover": "/api/documents/discover",
+    "query": "/api/query",
+}
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class _TTLCache:
+    """Small time-based cache for read-only results.
+
+    Entries expire `ttl` seconds after insertion; a TTL of 0 disables
+    caching entirely. The cache holds at most `maxsize` entries so a
+    long-running server can't accumulate unbounded formatted results:
+    inserting into a full cache first sweeps expired entries, then
+    evicts the oldest insertion (FIFO) if still full.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 256) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict[Any, tuple[float, Any]] = {}
+
+    def get(self, key: Any) -> Any | None:
+        """Return the cached value for key, or None if missing/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expiry, value = entry
+        if time.monotonic() >= expiry:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Store a value for key with the configured TTL."""
+        if self.ttl <= 0:
+            return
+        now = time.monotonic()
+        self._entries.pop(key, None)
+        if len(self._entries) >= self.maxsize:
+            expired = [k for k, (expiry, _) in self._entries.items() if now >= expiry]
+            for k in expired:
+                del self._entries[k]
+            if len(self._entries) >= self.maxsize:
+                # Dicts iterate in insertion order, so this is the oldest
+                del self._entries[next(iter(self._entries))]
+        self._entries[key] = (now + self.ttl, value)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+
 
 class RAGBrainClient:
-    """HTTP client for communicating with RAGBrain API.
+    """Async HTTP client for communicating with RAGBrain API.
 
     This client handles all HTTP communication with the RAGBrain backend,
-    including proper error handling and response parsing.
+    including proper error handling and response parsing. All request
+    methods are coroutines so tool handlers can overlap I/O instead of
+    blocking the MCP server's event loop.
     """
 
     def __init__(self, settings: Settings) -> None:
@@ -25,26 +90,55 @@ class RAGBrainClient:
         """
         self.base_url = settings.url
         self.timeout = settings.timeout
-        self._client: httpx.Client | None = None
+        self._client: httpx.AsyncClient | None = None
+        # Join base URL and endpoint paths once instead of per request
+        self._urls = {name: self.base_url + path for name, path in _ENDPOINTS.items()}
+        self._doc_url_prefix = self.base_url + "/api/documents/id/"
+        # In-flight GETs keyed by (path, params) so concurrent identical
+        # requests share one HTTP round trip
+        self._inflight: dict[tuple[str, Any], asyncio.Future[dict[str, Any]]] = {}
+        # Short-TTL cache for namespace listings, which change slowly but
+        # are refetched by nearly every session
+        self._cache = _TTLCache(settings.cache_ttl_seconds)
+        # Last ETag (and the body it validated) per cached endpoint, so
+        # refetches after TTL expiry can revalidate with If-None-Match
+        # instead of re-downloading an unchanged listing
+        self._etags: dict[Any, str] = {}
+        self._etag_bodies: dict[Any, dict[str, Any]] = {}
 
     @property
-    def client(self) -> httpx.Client:
-        """Lazy-initialize and return the HTTP client."""
+    def client(self) -> httpx.AsyncClient:
+        """Lazy-initialize and return the HTTP client.
+
+        The client keeps a pool of warm keep-alive connections (with HTTP/2
+        multiplexing when the server supports it) so repeated tool calls to
+        the same RAGBrain host skip TCP and TLS handshakes.
+        """
         if self._client is None:
-            self._client = httpx.Client(timeout=self.timeout)
+            self._client = httpx.AsyncClient(
+                # Fail fast on unreachable hosts; the generous overall
+                # timeout is meant for slow queries, not dead sockets
+                timeout=httpx.Timeout(self.timeout, connect=5.0),
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=60.0,
+                ),
+            )
         return self._client
 
-    def close(self) -> None:
+    async def aclose(self) -> None:
         """Close the HTTP client connection."""
         if self._client is not None:
-            self._client.close()
+            await self._client.aclose()
             self._client = None
 
-    def _get(self, path: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
+    async def _get(self, url: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
         """Make GET request to RAGBrain API.
 
         Args:
-            path: API endpoint path.
+            url: Full endpoint URL.
             params: Optional query parameters.
 
         Returns:
@@ -54,17 +148,37 @@ class RAGBrainClient:
             httpx.HTTPStatusError: If the request fails.
             httpx.ConnectError: If connection fails.
         """
-        url = f"{self.base_url}{path}"
-        logger.debug(f"GET {url} params={params}")
-        response = self.client.get(url, params=params)
-        response.raise_for_status()
-        return response.json()
-
-    def _post(self, path: str, data: dict[str, Any] | None = None) -> dict[str, Any]:
+        key = (url, tuple(sorted(params.items())) if params else None)
+        existing = self._inflight.get(key)
+        if existing is not None:
+            # An identical request is already on the wire; share its result.
+            # shield() keeps a cancelled waiter from cancelling the shared future.
+            return await asyncio.shield(existing)
+
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            logger.debug("GET %s params=%s", url, params)
+            response = await self.client.get(url, params=params)
+            response.raise_for_status()
+            # orjson is considerably faster than the stdlib decoder on the
+            # large search/document payloads
+            result = orjson.loads(response.content)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved in case no waiter is attached
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _post(self, url: str, data: dict[str, Any] | None = None) -> dict[str, Any]:
         """Make POST request to RAGBrain API.
 
         Args:
-            path: API endpoint path.
+            url: Full endpoint URL.
             data: JSON body data.
 
         Returns:
@@ -74,21 +188,95 @@ class RAGBrainClient:
             httpx.HTTPStatusError: If the request fails.
             httpx.ConnectError: If connection fails.
         """
-        url = f"{self.base_url}{path}"
-        logger.debug(f"POST {url} data={data}")
-        response = self.client.post(url, json=data)
+        logger.debug("POST %s data=%s", url, data)
+        # Serialize with orjson as well, bypassing httpx's stdlib json.dumps
+        body = orjson.dumps(data) if data is not None else None
+        response = await self.client.post(url, content=body, headers=_JSON_HEADERS)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
+
+    async def _get_cached(
+        self, url: str, params: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Make GET request with a short-TTL cache in front of it.
+
+        Args:
+            url: Full endpoint URL.
+            params: Optional query parameters.
+
+        Returns:
+            JSON response as dictionary (possibly cached).
+        """
+        key = (url, tuple(sorted(params.items())) if params else None)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        result = await self._get_conditional(url, params, key)
+        self._cache.set(key, result)
+        return result
+
+    async def _get_conditional(
+        self, url: str, params: dict[str, Any] | None, key: Any
+    ) -> dict[str, Any]:
+        """Make GET request, revalidating against the last ETag seen.
+
+        When the previous response for this key carried an ETag, the
+        request goes out with If-None-Match; a 304 reply has no body, so
+        the server skips serialization and we skip the JSON decode,
+        reusing the body that ETag validated. Servers that never send
+        ETags fall through to a plain GET transparently.
+
+        Args:
+            url: Full endpoint URL.
+            params: Optional query parameters.
+            key: Cache key identifying this endpoint + params combination.
 
-    def health_check(self) -> dict[str, Any]:
+        Returns:
+            JSON response as dictionary (possibly the revalidated body).
+        """
+        existing = self._inflight.get(key)
+        if existing is not None:
+            return await asyncio.shield(existing)
+
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            etag = self._etags.get(key)
+            headers = {"If-None-Match": etag} if etag is not None else None
+            logger.debug("GET %s params=%s etag=%s", url, params, etag)
+            response = await self.client.get(url, params=params, headers=headers)
+            if response.status_code == 304 and key in self._etag_bodies:
+                result = self._etag_bodies[key]
+            else:
+                response.raise_for_status()
+                result = orjson.loads(response.content)
+                new_etag = response.headers.get("etag")
+                if new_etag:
+                    self._etags[key] = new_etag
+                    self._etag_bodies[key] = result
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved in case no waiter is attached
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def clear_cache(self) -> None:
+        """Drop any cached responses."""
+        self._cache.clear()
+
+    async def health_check(self) -> dict[str, Any]:
         """Check if RAGBrain API is healthy.
 
         Returns:
             Health status response.
         """
-        return self._get("/health")
+        return await self._get(self._urls["health"])
 
-    def list_namespaces(self, include_stats: bool = True) -> dict[str, Any]:
+    async def list_namespaces(self, include_stats: bool = True) -> dict[str, Any]:
         """List all namespaces with optional statistics.
 
         Args:
@@ -97,12 +285,12 @@ class RAGBrainClient:
         Returns:
             Response containing list of namespaces.
         """
-        return self._get(
-            "/api/namespaces",
+        return await self._get_cached(
+            self._urls["namespaces"],
             {"include_stats": include_stats, "include_children": True},
         )
 
-    def get_namespace_tree(self, include_stats: bool = True) -> dict[str, Any]:
+    async def get_namespace_tree(self, include_stats: bool = True) -> dict[str, Any]:
         """Get namespace hierarchy as a tree structure.
 
         Args:
@@ -111,9 +299,11 @@ class RAGBrainClient:
         Returns:
             Response containing namespace tree.
         """
-        return self._get("/api/namespaces/tree", {"include_stats": include_stats})
+        return await self._get_cached(
+            self._urls["namespace_tree"], {"include_stats": include_stats}
+        )
 
-    def browse_namespace(self, namespace: str, limit: int = 50) -> dict[str, Any]:
+    async def browse_namespace(self, namespace: str, limit: int = 50) -> dict[str, Any]:
         """List documents in a namespace.
 
         Args:
@@ -124,18 +314,21 @@ class RAGBrainClient:
             Response containing document list.
         """
         # Use /api/documents which queries Qdrant directly via document summaries
-        # This doesn't require the namespace to exist in Redis
-        result = self._get("/api/documents", {"namespace": namespace})
+        # This doesn't require the namespace to exist in Redis.
+        # The limit is applied server-side so bandwidth and JSON decode time
+        # scale with the limit rather than the namespace size.
+        result = await self._get(
+            self._urls["documents"], {"namespace": namespace, "limit": limit}
+        )
 
-        # Apply limit and format response to match expected structure
-        documents = result.get("documents", [])[:limit]
+        documents = result.get("documents", [])
         return {
             "namespace": namespace,
             "documents": documents,
-            "total": len(documents)
+            "total": result.get("total", len(documents)),
         }
 
-    def search(
+    async def search(
         self,
         query: str,
         namespace: str | None = None,
@@ -157,20 +350,53 @@ class RAGBrainClient:
         }
         if namespace:
             data["namespace"] = namespace
-        return self._post("/api/query", data)
+        return await self._post(self._urls["query"], data)
 
-    def get_document(self, doc_id: str) -> dict[str, Any]:
+    async def get_document(
+        self, doc_id: str, max_length: int | None = None
+    ) -> dict[str, Any]:
         """Get full document content by ID.
 
         Args:
             doc_id: Document UUID.
+            max_length: Optional character cap; passed to the API as
+                `max_chars` so oversized documents are truncated before
+                serialization instead of after download.
 
         Returns:
-            Response containing full document content.
+            Response containing full document content. When the server
+            truncates, the response carries a `truncated` flag.
         """
-        return self._get(f"/api/documents/id/{doc_id}")
+        params = {"max_chars": max_length} if max_length else None
+        return await self._get(self._doc_url_prefix + doc_id, params)
+
+    async def get_documents_bulk(self, doc_ids: list[str]) -> list[dict[str, Any]]:
+        """Get full content for several documents in one round trip.
 
-    def discover_documents(
+        Uses the batched `/api/documents/bulk` endpoint so N document
+        fetches cost a single request. Older backends without the endpoint
+        are handled by fanning out concurrent per-document requests.
+
+        Args:
+            doc_ids: Document UUIDs to fetch.
+
+        Returns:
+            Document responses in the same order as `doc_ids`.
+        """
+        if not doc_ids:
+            return []
+        try:
+            result = await self._post(self._urls["documents_bulk"], {"ids": doc_ids})
+            return result.get("documents", [])
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != 404:
+                raise
+            # Backend predates the bulk endpoint; degrade to parallel fetches
+            return list(
+                await asyncio.gather(*(self.get_document(i) for i in doc_ids))
+            )
+
+    async def discover_documents(
         self,
         query: str,
         namespace: str | None = None,
@@ -195,4 +421,39 @@ class RAGBrainClient:
         }
         if namespace:
             params["namespace"] = namespace
-        return self._get("/api/documents/discover", params)
+        return await self._get(self._urls["discover"], params)
+
+    async def discover_and_fetch(
+        self,
+        query: str,
+        namespace: str | None = None,
+        top_k: int = 10,
+        max_length: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Discover documents for a query and fetch their full bodies.
+
+        The per-document fetches run concurrently via asyncio.gather, so
+        over the pooled HTTP/2 connection total latency approaches the
+        discovery round trip plus the slowest single fetch rather than
+        the sum of all fetches.
+
+        Args:
+            query: Semantic search query.
+            namespace: Optional namespace filter (supports wildcards like 'mba/*').
+            top_k: Number of documents to discover and fetch.
+            max_length: Optional character cap applied to each document.
+
+        Returns:
+            Full document responses in discovery (relevance) order.
+        """
+        result = await self.discover_documents(query, namespace, top_k)
+        doc_ids = [
+            doc["doc_id"] for doc in result.get("documents", []) if doc.get("doc_id")
+        ]
+        if not doc_ids:
+            return []
+        return list(
+            await asyncio.gather(
+                *(self.get_document(doc_id, max_length) for doc_id in doc_ids)
+            )
+        )
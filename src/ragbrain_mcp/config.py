@@ -1,5 +1,8 @@
 """Configuration management for RAGBrain MCP server."""
 
+import logging
+from functools import cached_property, lru_cache
+
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -34,6 +37,18 @@ class Settings(BaseSettings):
         description="Logging level (DEBUG, INFO, WARNING, ERROR)",
     )
 
+    cache_enabled: bool = Field(
+        default=True,
+        description="Whether to cache read-only tool results in-process",
+    )
+
+    cache_ttl_seconds: float = Field(
+        default=30.0,
+        ge=0.0,
+        le=3600.0,
+        description="TTL for cached namespace listings in seconds (0 disables caching)",
+    )
+
     max_results: int = Field(
         default=20,
         ge=1,
@@ -65,7 +80,13 @@ class Settings(BaseSettings):
             raise ValueError("URL must start with http:// or https://")
         return v.rstrip("/")
 
+    @cached_property
+    def log_level_int(self) -> int:
+        """Numeric value of the configured log level, computed once."""
+        return getattr(logging, self.log_level)  # type: ignore[no-any-return]
+
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
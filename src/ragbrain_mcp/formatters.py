@@ -4,11 +4,18 @@ These formatters convert RAGBrain API responses into human-readable
 Markdown format suitable for display in Claude.
 """
 
+import io
 from typing import Any
 
 # Maximum length for truncated content
 MAX_CHUNK_LENGTH = 1000
 
+# Static response headers, rendered once at import time
+_NS_LIST_HEADER = "# RAGBrain Namespaces\n"
+_NS_TREE_HEADER = "# RAGBrain Namespace Tree\n\n"
+_SEARCH_HEADER = "# Search Results\n"
+_DISCOVER_HEADER = "# Document Discovery Results\n"
+
 
 def format_namespace_list(namespaces: list[dict[str, Any]]) -> str:
     """Format namespace list as Markdown.
@@ -22,7 +29,9 @@ def format_namespace_list(namespaces: list[dict[str, Any]]) -> str:
     if not namespaces:
         return "No namespaces found. Create one in the RAGBrain UI."
 
-    lines = ["# RAGBrain Namespaces\n"]
+    buf = io.StringIO()
+    buf.write(_NS_LIST_HEADER)
+    buf.write("\n")
 
     for ns in namespaces:
         doc_count = ns.get("doc_count", 0)
@@ -31,47 +40,50 @@ def format_namespace_list(namespaces: list[dict[str, Any]]) -> str:
         name = ns.get("name", "Unknown")
         ns_id = ns.get("id", "")
 
-        lines.append(f"## {name}")
-        lines.append(f"**ID:** `{ns_id}`")
+        buf.write(f"## {name}\n**ID:** `{ns_id}`\n")
         if desc:
-            lines.append(f"*{desc}*")
-        lines.append(f"Documents: {doc_count} | Chunks: {chunk_count}")
-        lines.append("")
+            buf.write(f"*{desc}*\n")
+        buf.write(f"Documents: {doc_count} | Chunks: {chunk_count}\n\n")
 
-    return "\n".join(lines)
+    # Drop the final blank-separator newline to match the joined-lines output
+    return buf.getvalue()[:-1]
 
 
-def format_namespace_tree(tree: list[dict[str, Any]], indent: int = 0) -> str:
+def format_namespace_tree(tree: list[dict[str, Any]]) -> str:
     """Format namespace tree as Markdown with indentation.
 
+    Traverses the tree iteratively with an explicit stack, so formatting
+    stays a single flat loop regardless of hierarchy depth (no per-node
+    call frames, no RecursionError on pathological trees).
+
     Args:
         tree: List of namespace tree nodes from API.
-        indent: Current indentation level.
 
     Returns:
         Formatted Markdown string.
     """
-    if not tree and indent == 0:
+    if not tree:
         return "No namespaces found. Create one in the RAGBrain UI."
 
-    lines = []
-
-    if indent == 0:
-        lines.append("# RAGBrain Namespace Tree\n")
+    buf = io.StringIO()
+    buf.write(_NS_TREE_HEADER)
 
-    for node in tree:
+    # Depth-first: push roots reversed so siblings come off in order
+    stack: list[tuple[dict[str, Any], int]] = [(node, 0) for node in reversed(tree)]
+    while stack:
+        node, indent = stack.pop()
         prefix = "  " * indent
         doc_count = node.get("doc_count", 0)
         name = node.get("name", "Unknown")
         ns_id = node.get("id", "")
 
-        lines.append(f"{prefix}- **{name}** (`{ns_id}`) — {doc_count} docs")
+        buf.write(f"{prefix}- **{name}** (`{ns_id}`) — {doc_count} docs\n")
 
         children = node.get("children", [])
         if children:
-            lines.append(format_namespace_tree(children, indent + 1))
+            stack.extend((child, indent + 1) for child in reversed(children))
 
-    return "\n".join(lines)
+    return buf.getvalue().rstrip("\n")
 
 
 def format_search_results(result: dict[str, Any]) -> str:
@@ -83,14 +95,17 @@ def format_search_results(result: dict[str, Any]) -> str:
     Returns:
         Formatted Markdown string.
     """
-    lines = ["# Search Results\n"]
+    buf = io.StringIO()
+    buf.write(_SEARCH_HEADER)
 
     # Show individual chunks (API returns "sources" with "content")
     chunks = result.get("sources", [])
     if not chunks:
-        lines.append("No results found for this query.")
-        return "\n".join(lines)
+        buf.write("\nNo results found for this query.")
+        return buf.getvalue()
 
+    buf.write("\n")
+    max_len = MAX_CHUNK_LENGTH  # Local binding for the hot loop
     for i, chunk in enumerate(chunks, 1):
         score = chunk.get("score", 0)
         text = chunk.get("content", "")
@@ -99,14 +114,16 @@ def format_search_results(result: dict[str, Any]) -> str:
         namespace = metadata.get("namespace", "default")
 
         # Truncate long text
-        if len(text) > MAX_CHUNK_LENGTH:
-            text = text[:MAX_CHUNK_LENGTH] + "..."
+        if len(text) > max_len:
+            text = text[:max_len] + "..."
 
-        lines.append(f"### Result {i} (score: {score:.3f})")
-        lines.append(f"**Source:** {filename} | **Namespace:** {namespace}")
-        lines.append(f"\n{text}\n")
+        buf.write(
+            f"### Result {i} (score: {score:.3f})\n"
+            f"**Source:** {filename} | **Namespace:** {namespace}\n\n{text}\n\n"
+        )
 
-    return "\n".join(lines)
+    # Drop the final blank-separator newline to match the joined-lines output
+    return buf.getvalue()[:-1]
 
 
 def format_document_list(result: dict[str, Any]) -> str:
@@ -122,25 +139,25 @@ def format_document_list(result: dict[str, Any]) -> str:
     documents = result.get("documents", [])
     total = result.get("total", len(documents))
 
-    lines = [f"# Documents in `{namespace}`\n"]
-    lines.append(f"**Total:** {total} documents\n")
+    buf = io.StringIO()
+    buf.write(f"# Documents in `{namespace}`\n\n**Total:** {total} documents\n\n")
 
     if not documents:
-        lines.append("No documents found in this namespace.")
-        return "\n".join(lines)
+        buf.write("No documents found in this namespace.")
+        return buf.getvalue()
 
     for doc in documents:
         filename = doc.get("filename", "Untitled")
         doc_id = doc.get("doc_id", "")
         # Handle both field names (total_chunks from old API, chunk_count from new)
         chunks = doc.get("total_chunks") or doc.get("chunk_count", "?")
-        created = doc.get("created_at", "")[:10] if doc.get("created_at") else "N/A"
+        created = (doc.get("created_at") or "")[:10] or "N/A"
 
-        lines.append(f"- **{filename}**")
-        lines.append(f"  - ID: `{doc_id}`")
-        lines.append(f"  - Chunks: {chunks} | Created: {created}")
+        buf.write(
+            f"- **{filename}**\n  - ID: `{doc_id}`\n  - Chunks: {chunks} | Created: {created}\n"
+        )
 
-    return "\n".join(lines)
+    return buf.getvalue().rstrip("\n")
 
 
 def format_document(result: dict[str, Any], max_length: int = 100000) -> str:
@@ -159,8 +176,9 @@ def format_document(result: dict[str, Any], max_length: int = 100000) -> str:
     total_chunks = result.get("total_chunks", 0)
     text = result.get("reconstructed_text", "")
 
-    # Truncate if too long
-    truncated = False
+    # The API truncates server-side when asked via max_chars; fall back to
+    # a client-side slice for backends that ignore the parameter
+    truncated = bool(result.get("truncated", False))
     if len(text) > max_length:
         text = text[:max_length]
         truncated = True
@@ -196,13 +214,13 @@ def format_discover_results(result: dict[str, Any]) -> str:
     documents = result.get("documents", [])
     count = result.get("count", len(documents))
 
-    lines = [f"# Document Discovery Results\n"]
-    lines.append(f"**Query:** {query}")
-    lines.append(f"**Found:** {count} documents\n")
+    buf = io.StringIO()
+    buf.write(_DISCOVER_HEADER)
+    buf.write(f"\n**Query:** {query}\n**Found:** {count} documents\n\n")
 
     if not documents:
-        lines.append("No documents found matching this query.")
-        return "\n".join(lines)
+        buf.write("No documents found matching this query.")
+        return buf.getvalue()
 
     for i, doc in enumerate(documents, 1):
         filename = doc.get("filename", "Untitled")
@@ -213,22 +231,25 @@ def format_discover_results(result: dict[str, Any]) -> str:
         headings = doc.get("headings", [])
         preview = doc.get("summary_preview", "")
 
-        lines.append(f"### {i}. {filename} (score: {score:.3f})")
-        lines.append(f"**ID:** `{doc_id}` | **Namespace:** {namespace} | **Chunks:** {chunk_count}")
+        buf.write(
+            f"### {i}. {filename} (score: {score:.3f})\n"
+            f"**ID:** `{doc_id}` | **Namespace:** {namespace} | **Chunks:** {chunk_count}\n"
+        )
 
         if headings:
             # Show first 5 headings
             heading_str = ", ".join(headings[:5])
             if len(headings) > 5:
                 heading_str += f" (+{len(headings) - 5} more)"
-            lines.append(f"**Headings:** {heading_str}")
+            buf.write(f"**Headings:** {heading_str}\n")
 
         if preview:
             # Truncate preview if too long
             if len(preview) > 200:
                 preview = preview[:200] + "..."
-            lines.append(f"\n*{preview}*")
+            buf.write(f"\n*{preview}*\n")
 
-        lines.append("")
+        buf.write("\n")
 
-    return "\n".join(lines)
+    # Drop the last blank-separator newline to match the joined-lines output
+    return buf.getvalue()[:-1]
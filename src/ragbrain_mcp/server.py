@@ -39,11 +39,11 @@ from .tools import ToolHandler, get_tool_definitions
 logger = logging.getLogger("ragbrain-mcp")
 
 
-def configure_logging(level: str) -> None:
+def configure_logging(level: int) -> None:
     """Configure logging for the MCP server.
 
     Args:
-        level: Logging level string (DEBUG, INFO, WARNING, ERROR).
+        level: Numeric logging level (e.g. logging.INFO).
     """
     logging.basicConfig(
         level=level,
@@ -63,6 +63,9 @@ def create_server(settings: Settings) -> tuple[Server, RAGBrainClient, ToolHandl
     """
     server = Server("ragbrain")
     client = RAGBrainClient(settings)
+    # Build the connection pool up front so the first tool call
+    # doesn't pay the client construction cost
+    _ = client.client
     tool_handler = ToolHandler(client, settings)
 
     @server.list_tools()
@@ -86,20 +89,20 @@ async def check_health(client: RAGBrainClient, url: str) -> None:
         url: URL being checked (for logging).
     """
     try:
-        health = client.health_check()
+        health = await client.health_check()
         status = health.get("status", "unknown")
-        logger.info(f"RAGBrain health check: {status}")
+        logger.info("RAGBrain health check: %s", status)
     except Exception as e:
-        logger.warning(f"Could not connect to RAGBrain at {url}: {e}")
+        logger.warning("Could not connect to RAGBrain at %s: %s", url, e)
         logger.warning("Server will start but tools may fail until RAGBrain is available")
 
 
 async def run_server() -> None:
     """Run the MCP server with stdio transport."""
     settings = get_settings()
-    configure_logging(settings.log_level)
+    configure_logging(settings.log_level_int)
 
-    logger.info(f"Starting RAGBrain MCP server (connecting to {settings.url})")
+    logger.info("Starting RAGBrain MCP server (connecting to %s)", settings.url)
 
     server, client, _ = create_server(settings)
 
@@ -114,7 +117,7 @@ async def run_server() -> None:
                 server.create_initialization_options(),
             )
     finally:
-        client.close()
+        await client.aclose()
 
 
 def main() -> None:
@@ -124,7 +127,7 @@ def main() -> None:
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.exception(f"Server error: {e}")
+        logger.exception("Server error: %s", e)
         sys.exit(1)
 
 
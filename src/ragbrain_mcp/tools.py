@@ -4,15 +4,19 @@ This module defines the MCP tools exposed by the RAGBrain server and
 contains the logic for handling tool calls.
 """
 
+import asyncio
 import json
 import logging
-from dataclasses import dataclass
+import re
+from collections.abc import Awaitable, Callable
 from typing import Any
 
 import httpx
+import orjson
 from mcp.types import TextContent, Tool
+from pydantic import BaseModel, ValidationError, field_validator
 
-from .client import RAGBrainClient
+from .client import RAGBrainClient, _TTLCache
 from .config import Settings
 from .formatters import (
     format_discover_results,
@@ -33,166 +37,321 @@ TOOL_BROWSE_NAMESPACE = "ragbrain_browse_namespace"
 TOOL_GET_DOCUMENT = "ragbrain_get_document"
 TOOL_DISCOVER_DOCUMENTS = "ragbrain_discover_documents"
 
+# Caps shared between the declared inputSchema maxima and the runtime
+# clamps so the two can't drift apart. The Python MCP SDK does not
+# enforce inputSchema server-side, so the handlers still clamp.
+_SEARCH_TOP_K_MAX = 20
+_DISCOVER_TOP_K_MAX = 50
+_BROWSE_LIMIT_MAX = 200
 
-@dataclass
-class ToolError:
-    """Represents an error that occurred during tool execution."""
+# Namespace strings must not escape the hierarchy: no absolute paths,
+# parent references, backslashes, or NUL bytes
+_BAD_NAMESPACE = re.compile(r"^/|\.\.|\\|\x00")
 
-    message: str
 
-    def to_content(self) -> list[TextContent]:
-        """Convert error to MCP TextContent."""
-        return [TextContent(type="text", text=f"Error: {self.message}")]
+def _invalid_namespace(namespace: str | None) -> bool:
+    """Check whether a namespace fails path-safety validation."""
+    if not namespace:
+        return False
+    return _BAD_NAMESPACE.search(namespace) is not None
 
 
-def get_tool_definitions() -> list[Tool]:
-    """Return the list of available MCP tools.
+class _ListNamespacesArgs(BaseModel):
+    """Validated arguments for the list_namespaces tool."""
 
-    Returns:
-        List of Tool definitions for MCP.
+    tree_view: bool = False
+
+
+class _SearchArgs(BaseModel):
+    """Validated arguments for the search tool."""
+
+    query: str
+    namespace: str | None = None
+    top_k: int = 5
+
+    @field_validator("query")
+    @classmethod
+    def _query_not_blank(cls, v: str) -> str:
+        v = v.strip()
+        if not v:
+            raise ValueError("'query' parameter is required")
+        return v
+
+    @field_validator("namespace")
+    @classmethod
+    def _namespace_is_safe(cls, v: str | None) -> str | None:
+        if _invalid_namespace(v):
+            raise ValueError("Invalid namespace format")
+        return v
+
+
+class _BrowseNamespaceArgs(BaseModel):
+    """Validated arguments for the browse_namespace tool."""
+
+    namespace: str
+    limit: int = 50
+
+    @field_validator("namespace")
+    @classmethod
+    def _namespace_not_blank_and_safe(cls, v: str) -> str:
+        v = v.strip()
+        if not v:
+            raise ValueError("'namespace' parameter is required")
+        if _invalid_namespace(v):
+            raise ValueError("Invalid namespace format")
+        return v
+
+
+class _GetDocumentArgs(BaseModel):
+    """Validated arguments for the get_document tool."""
+
+    doc_id: str
+
+    @field_validator("doc_id")
+    @classmethod
+    def _doc_id_not_blank(cls, v: str) -> str:
+        v = v.strip()
+        if not v:
+            raise ValueError("'doc_id' parameter is required")
+        return v
+
+
+class _DiscoverDocumentsArgs(_SearchArgs):
+    """Validated arguments for the discover_documents tool.
+
+    Same shape and validation as search, with a larger default top_k.
     """
-    return [
-        Tool(
-            name=TOOL_LIST_NAMESPACES,
-            description=(
-                "List all namespaces in the RAGBrain knowledge base. "
-                "Returns namespace names, descriptions, document counts, and hierarchy. "
-                "Use this to discover what knowledge areas are available."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "tree_view": {
-                        "type": "boolean",
-                        "description": (
-                            "If true, returns namespaces as a hierarchical tree. "
-                            "If false, returns flat list. Default: false"
-                        ),
-                    }
-                },
-                "required": [],
+
+    top_k: int = 10
+
+
+# Longest argument value to reproduce verbatim in logs
+_LOG_ARG_MAX = 128
+
+
+def _redact(arguments: dict[str, Any]) -> dict[str, Any]:
+    """Shorten long string argument values for logging."""
+    return {
+        key: value[:_LOG_ARG_MAX] + "..."
+        if isinstance(value, str) and len(value) > _LOG_ARG_MAX
+        else value
+        for key, value in arguments.items()
+    }
+
+
+def _error(message: str) -> list[TextContent]:
+    """Render an error message as an MCP tool response."""
+    return [TextContent(type="text", text=f"Error: {message}")]
+
+
+# Fixed error messages, rendered to content once at import time so the
+# common validation failures return a constant instead of allocating
+_ERR_QUERY_REQUIRED = _error("'query' parameter is required")
+_ERR_NAMESPACE_REQUIRED = _error("'namespace' parameter is required")
+_ERR_DOC_ID_REQUIRED = _error("'doc_id' parameter is required")
+_ERR_INVALID_NAMESPACE = _error("Invalid namespace format")
+_ERR_TIMEOUT = _error("Request timed out. RAGBrain may be slow or unresponsive.")
+_ERR_BAD_RESPONSE = _error("Invalid response from RAGBrain API")
+_ERR_UNEXPECTED = _error("An unexpected error occurred")
+
+# Map validator messages back onto the pre-rendered constants above
+_ERR_BY_MESSAGE = {
+    "'query' parameter is required": _ERR_QUERY_REQUIRED,
+    "'namespace' parameter is required": _ERR_NAMESPACE_REQUIRED,
+    "'doc_id' parameter is required": _ERR_DOC_ID_REQUIRED,
+    "Invalid namespace format": _ERR_INVALID_NAMESPACE,
+}
+
+
+def _validation_error_content(e: ValidationError) -> list[TextContent]:
+    """Render a pydantic validation failure as a tool error response."""
+    err = e.errors()[0]
+    if err["type"] == "missing":
+        message = f"'{err['loc'][0]}' parameter is required"
+    else:
+        # ValueError raised in a validator surfaces as "Value error, <msg>"
+        message = err["msg"].removeprefix("Value error, ")
+    cached = _ERR_BY_MESSAGE.get(message)
+    if cached is not None:
+        return cached
+    return _error(message)
+
+# Tool definitions are static, so build (and Pydantic-validate) them once
+# at import time instead of on every list_tools request
+_TOOL_DEFINITIONS: list[Tool] = [
+    Tool(
+        name=TOOL_LIST_NAMESPACES,
+        description=(
+            "List all namespaces in the RAGBrain knowledge base. "
+            "Returns namespace names, descriptions, document counts, and hierarchy. "
+            "Use this to discover what knowledge areas are available."
+        ),
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "tree_view": {
+                    "type": "boolean",
+                    "description": (
+                        "If true, returns namespaces as a hierarchical tree. "
+                        "If false, returns flat list. Default: false"
+                    ),
+                }
             },
+            "required": [],
+        },
+    ),
+    Tool(
+        name=TOOL_SEARCH,
+        description=(
+            "Perform semantic search across the RAGBrain knowledge base. "
+            "Returns relevant text chunks that match the query. "
+            "Use this to find information on any topic stored in RAGBrain."
         ),
-        Tool(
-            name=TOOL_SEARCH,
-            description=(
-                "Perform semantic search across the RAGBrain knowledge base. "
-                "Returns relevant text chunks that match the query. "
-                "Use this to find information on any topic stored in RAGBrain."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "The search query - can be a question or topic",
-                        "minLength": 1,
-                        "maxLength": 1000,
-                    },
-                    "namespace": {
-                        "type": "string",
-                        "description": (
-                            "Optional: limit search to a specific namespace "
-                            "(e.g., 'mba/finance'). Supports wildcards like 'mba/*'"
-                        ),
-                    },
-                    "top_k": {
-                        "type": "integer",
-                        "description": "Number of results to return (default: 5, max: 20)",
-                        "minimum": 1,
-                        "maximum": 20,
-                        "default": 5,
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "The search query - can be a question or topic",
+                    "minLength": 1,
+                    "maxLength": 1000,
+                },
+                "namespace": {
+                    "type": "string",
+                    "description": (
+                        "Optional: limit search to a specific namespace "
+                        "(e.g., 'mba/finance'). Supports wildcards like 'mba/*'"
+                    ),
+                },
+                "top_k": {
+                    "type": "integer",
+                    "description": (
+                        f"Number of results to return (default: 5, max: {_SEARCH_TOP_K_MAX})"
+                    ),
+                    "minimum": 1,
+                    "maximum": _SEARCH_TOP_K_MAX,
+                    "default": 5,
                 },
-                "required": ["query"],
             },
+            "required": ["query"],
+        },
+    ),
+    Tool(
+        name=TOOL_BROWSE_NAMESPACE,
+        description=(
+            "List all documents stored in a specific namespace. "
+            "Returns document names, IDs, chunk counts, and creation dates. "
+            "Use this to see what's in a particular knowledge area."
         ),
-        Tool(
-            name=TOOL_BROWSE_NAMESPACE,
-            description=(
-                "List all documents stored in a specific namespace. "
-                "Returns document names, IDs, chunk counts, and creation dates. "
-                "Use this to see what's in a particular knowledge area."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "namespace": {
-                        "type": "string",
-                        "description": "The namespace to browse (e.g., 'personal', 'work/projects')",
-                        "minLength": 1,
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "description": "Maximum number of documents to return (default: 50)",
-                        "minimum": 1,
-                        "maximum": 200,
-                        "default": 50,
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "namespace": {
+                    "type": "string",
+                    "description": "The namespace to browse (e.g., 'personal', 'work/projects')",
+                    "minLength": 1,
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum number of documents to return (default: 50)",
+                    "minimum": 1,
+                    "maximum": _BROWSE_LIMIT_MAX,
+                    "default": 50,
                 },
-                "required": ["namespace"],
             },
+            "required": ["namespace"],
+        },
+    ),
+    Tool(
+        name=TOOL_GET_DOCUMENT,
+        description=(
+            "Retrieve the full content of a specific document by its ID. "
+            "Returns the complete reconstructed text from all chunks. "
+            "Use this when you need to read an entire document."
         ),
-        Tool(
-            name=TOOL_GET_DOCUMENT,
-            description=(
-                "Retrieve the full content of a specific document by its ID. "
-                "Returns the complete reconstructed text from all chunks. "
-                "Use this when you need to read an entire document."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "doc_id": {
-                        "type": "string",
-                        "description": "The document ID (UUID) to retrieve",
-                        "minLength": 1,
-                    }
-                },
-                "required": ["doc_id"],
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "doc_id": {
+                    "type": "string",
+                    "description": "The document ID (UUID) to retrieve",
+                    "minLength": 1,
+                }
             },
+            "required": ["doc_id"],
+        },
+    ),
+    Tool(
+        name=TOOL_DISCOVER_DOCUMENTS,
+        description=(
+            "Discover documents by semantic search over their summaries. "
+            "Use this to find documents about a topic BEFORE searching for specific content. "
+            "Returns document titles, headings, and relevance scores. "
+            "Example queries: 'documents about leadership', 'notes on valuation', "
+            "'files covering conflict resolution'. "
+            "After discovering relevant documents, use ragbrain_search to find specific content."
         ),
-        Tool(
-            name=TOOL_DISCOVER_DOCUMENTS,
-            description=(
-                "Discover documents by semantic search over their summaries. "
-                "Use this to find documents about a topic BEFORE searching for specific content. "
-                "Returns document titles, headings, and relevance scores. "
-                "Example queries: 'documents about leadership', 'notes on valuation', "
-                "'files covering conflict resolution'. "
-                "After discovering relevant documents, use ragbrain_search to find specific content."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": (
-                            "Semantic query to find documents by topic or content. "
-                            "Can be a question, topic, or description of what you're looking for."
-                        ),
-                        "minLength": 1,
-                        "maxLength": 500,
-                    },
-                    "namespace": {
-                        "type": "string",
-                        "description": (
-                            "Optional: limit discovery to a specific namespace "
-                            "(e.g., 'mba/finance'). Supports wildcards like 'mba/*'"
-                        ),
-                    },
-                    "top_k": {
-                        "type": "integer",
-                        "description": "Number of documents to return (default: 10, max: 50)",
-                        "minimum": 1,
-                        "maximum": 50,
-                        "default": 10,
-                    },
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": (
+                        "Semantic query to find documents by topic or content. "
+                        "Can be a question, topic, or description of what you're looking for."
+                    ),
+                    "minLength": 1,
+                    "maxLength": 500,
+                },
+                "namespace": {
+                    "type": "string",
+                    "description": (
+                        "Optional: limit discovery to a specific namespace "
+                        "(e.g., 'mba/finance'). Supports wildcards like 'mba/*'"
+                    ),
+                },
+                "top_k": {
+                    "type": "integer",
+                    "description": (
+                        f"Number of documents to return (default: 10, max: {_DISCOVER_TOP_K_MAX})"
+                    ),
+                    "minimum": 1,
+                    "maximum": _DISCOVER_TOP_K_MAX,
+                    "default": 10,
                 },
-                "required": ["query"],
             },
-        ),
-    ]
+            "required": ["query"],
+        },
+    ),
+]
+
+
+# Serialized form of the definitions, encoded once for transports that
+# ship raw JSON instead of Tool objects
+_TOOL_DEFS_JSON: bytes = orjson.dumps(
+    [tool.model_dump(exclude_none=True) for tool in _TOOL_DEFINITIONS]
+)
+
+
+def get_tool_definitions() -> list[Tool]:
+    """Return the list of available MCP tools.
+
+    Returns:
+        List of Tool definitions for MCP.
+    """
+    return _TOOL_DEFINITIONS
+
+
+def get_tool_definitions_json() -> bytes:
+    """Return the tool definitions pre-serialized as JSON bytes.
+
+    Callers that write JSON to the wire can reuse this buffer instead of
+    re-running model_dump plus a JSON encode on every list_tools request.
+
+    Returns:
+        JSON-encoded array of tool definitions.
+    """
+    return _TOOL_DEFS_JSON
 
 
 class ToolHandler:
@@ -211,6 +370,27 @@ class ToolHandler:
         """
         self.client = client
         self.settings = settings
+        # Bind the hot-path limits once; pydantic attribute access goes
+        # through __getattr__ machinery and isn't free per tool call
+        self._max_results = settings.max_results
+        self._max_document_length = settings.max_document_length
+        # All five tools are read-only, so identical calls within the TTL
+        # window can reuse the formatted result without an HTTP round trip
+        self._cache: _TTLCache | None = (
+            _TTLCache(settings.cache_ttl_seconds) if settings.cache_enabled else None
+        )
+        # Single-flight map: concurrent identical calls await the first
+        # caller's future instead of dispatching their own backend request
+        self._inflight: dict[tuple[str, Any], asyncio.Future[list[TextContent]]] = {}
+        # Jump table so dispatch is one hash lookup instead of a chain
+        # of string comparisons
+        self._dispatch = {
+            TOOL_LIST_NAMESPACES: self._handle_list_namespaces,
+            TOOL_SEARCH: self._handle_search,
+            TOOL_BROWSE_NAMESPACE: self._handle_browse_namespace,
+            TOOL_GET_DOCUMENT: self._handle_get_document,
+            TOOL_DISCOVER_DOCUMENTS: self._handle_discover_documents,
+        }
 
     async def handle(self, name: str, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle a tool call.
@@ -222,82 +402,150 @@ class ToolHandler:
         Returns:
             List of TextContent with the tool result.
         """
-        logger.info(f"Tool called: {name} with args: {arguments}")
+        # Gate so the redacted-args dict is only built when INFO is emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Tool called: %s with args: %s", name, _redact(arguments))
+
+        handler = self._dispatch.get(name)
+        if handler is None:
+            return _error(f"Unknown tool: {name}")
+
+        key: tuple[str, Any] | None = None
+        if self._cache is not None:
+            try:
+                key = (name, tuple(sorted(arguments.items())))
+                hash(key)  # List/dict argument values raise here
+            except TypeError:
+                key = None  # Unhashable argument values; skip caching
+            if key is not None:
+                cached: list[TextContent] | None = self._cache.get(key)
+                if cached is not None:
+                    return cached
 
         try:
-            if name == TOOL_LIST_NAMESPACES:
-                return await self._handle_list_namespaces(arguments)
-            elif name == TOOL_SEARCH:
-                return await self._handle_search(arguments)
-            elif name == TOOL_BROWSE_NAMESPACE:
-                return await self._handle_browse_namespace(arguments)
-            elif name == TOOL_GET_DOCUMENT:
-                return await self._handle_get_document(arguments)
-            elif name == TOOL_DISCOVER_DOCUMENTS:
-                return await self._handle_discover_documents(arguments)
-            else:
-                return ToolError(f"Unknown tool: {name}").to_content()
+            result = await self._single_flight(key, handler, arguments)
+            if key is not None and self._cache is not None:
+                self._cache.set(key, result)
+            return result
+
+        except ValidationError as e:
+            return _validation_error_content(e)
 
         except httpx.HTTPStatusError as e:
-            logger.error(f"HTTP error calling {name}: {e}")
+            logger.error("HTTP error calling %s: %s", name, e)
             if e.response.status_code == 404:
-                return ToolError(f"Not found: {e.response.text}").to_content()
-            return ToolError(
-                f"API error ({e.response.status_code}): {e.response.text}"
-            ).to_content()
+                return _error(f"Not found: {e.response.text}")
+            return _error(f"API error ({e.response.status_code}): {e.response.text}")
 
         except httpx.ConnectError:
-            logger.error(f"Connection error to {self.settings.url}")
-            return ToolError(
+            logger.error("Connection error to %s", self.settings.url)
+            return _error(
                 f"Cannot connect to RAGBrain at {self.settings.url}. Is it running?"
-            ).to_content()
+            )
 
         except httpx.TimeoutException:
-            logger.error(f"Timeout connecting to {self.settings.url}")
-            return ToolError(
-                "Request timed out. RAGBrain may be slow or unresponsive."
-            ).to_content()
+            logger.error("Timeout connecting to %s", self.settings.url)
+            return _ERR_TIMEOUT
 
         except json.JSONDecodeError as e:
-            logger.error(f"JSON decode error: {e}")
-            return ToolError(
-                "Invalid response from RAGBrain API"
-            ).to_content()
+            logger.error("JSON decode error: %s", e)
+            return _ERR_BAD_RESPONSE
 
-        except Exception as e:
-            logger.exception(f"Unexpected error calling tool {name}")
+        except Exception:
+            logger.exception("Unexpected error calling tool %s", name)
             # Don't expose internal error details to client
-            return ToolError("An unexpected error occurred").to_content()
+            return _ERR_UNEXPECTED
+
+    async def handle_many(
+        self, calls: list[tuple[str, dict[str, Any]]]
+    ) -> list[list[TextContent]]:
+        """Handle several tool calls concurrently.
+
+        When an MCP client fans out multiple tool calls in one turn,
+        running them through asyncio.gather makes the slowest call the
+        wall-clock cost instead of the sum. Each call keeps handle()'s
+        per-call error handling, so one failure never poisons the batch.
+
+        Args:
+            calls: List of (tool name, arguments) pairs.
+
+        Returns:
+            Tool results in the same order as `calls`.
+        """
+        return list(
+            await asyncio.gather(*(self.handle(name, args) for name, args in calls))
+        )
+
+    async def _single_flight(
+        self,
+        key: tuple[str, Any] | None,
+        handler: Callable[[dict[str, Any]], Awaitable[list[TextContent]]],
+        arguments: dict[str, Any],
+    ) -> list[TextContent]:
+        """Run a handler, sharing the result with concurrent identical calls.
+
+        Mirrors the in-flight coalescing in RAGBrainClient._get, but at the
+        tool layer so duplicate POST-backed tools (search, discovery) are
+        deduplicated too. Safe without locks because asyncio runs a single
+        loop per thread.
+
+        Args:
+            key: Cache key for the call, or None if the args are unhashable.
+            handler: Bound handler coroutine function for the tool.
+            arguments: Tool arguments from MCP client.
+
+        Returns:
+            List of TextContent with the tool result.
+        """
+        if key is None:
+            return await handler(arguments)
+
+        existing = self._inflight.get(key)
+        if existing is not None:
+            return await asyncio.shield(existing)
+
+        future: asyncio.Future[list[TextContent]] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[key] = future
+        try:
+            result = await handler(arguments)
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved in case no waiter is attached
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def clear_cache(self) -> None:
+        """Drop any cached tool results."""
+        if self._cache is not None:
+            self._cache.clear()
 
     async def _handle_list_namespaces(
         self, arguments: dict[str, Any]
     ) -> list[TextContent]:
         """Handle list_namespaces tool call."""
-        tree_view = arguments.get("tree_view", False)
+        args = _ListNamespacesArgs.model_validate(arguments)
 
-        if tree_view:
-            result = self.client.get_namespace_tree(include_stats=True)
+        if args.tree_view:
+            result = await self.client.get_namespace_tree(include_stats=True)
             output = format_namespace_tree(result.get("tree", []))
         else:
-            result = self.client.list_namespaces(include_stats=True)
+            result = await self.client.list_namespaces(include_stats=True)
             output = format_namespace_list(result.get("namespaces", []))
 
         return [TextContent(type="text", text=output)]
 
     async def _handle_search(self, arguments: dict[str, Any]) -> list[TextContent]:
         """Handle search tool call."""
-        query = arguments.get("query", "").strip()
-        if not query:
-            return ToolError("'query' parameter is required").to_content()
-
-        namespace = arguments.get("namespace")
-        # Validate namespace to prevent path traversal
-        if namespace and (".." in namespace or namespace.startswith("/")):
-            return ToolError("Invalid namespace format").to_content()
+        args = _SearchArgs.model_validate(arguments)
+        top_k = min(args.top_k, _SEARCH_TOP_K_MAX, self._max_results)
 
-        top_k = min(arguments.get("top_k", 5), self.settings.max_results)
-
-        result = self.client.search(query, namespace, top_k)
+        result = await self.client.search(args.query, args.namespace, top_k)
         output = format_search_results(result)
 
         return [TextContent(type="text", text=output)]
@@ -306,16 +554,10 @@ class ToolHandler:
         self, arguments: dict[str, Any]
     ) -> list[TextContent]:
         """Handle browse_namespace tool call."""
-        namespace = arguments.get("namespace", "").strip()
-        if not namespace:
-            return ToolError("'namespace' parameter is required").to_content()
-
-        # Validate namespace to prevent path traversal
-        if ".." in namespace or namespace.startswith("/"):
-            return ToolError("Invalid namespace format").to_content()
+        args = _BrowseNamespaceArgs.model_validate(arguments)
+        limit = min(args.limit, _BROWSE_LIMIT_MAX)
 
-        limit = min(arguments.get("limit", 50), 200)
-        result = self.client.browse_namespace(namespace, limit)
+        result = await self.client.browse_namespace(args.namespace, limit)
         output = format_document_list(result)
 
         return [TextContent(type="text", text=output)]
@@ -324,12 +566,10 @@ class ToolHandler:
         self, arguments: dict[str, Any]
     ) -> list[TextContent]:
         """Handle get_document tool call."""
-        doc_id = arguments.get("doc_id", "").strip()
-        if not doc_id:
-            return ToolError("'doc_id' parameter is required").to_content()
+        args = _GetDocumentArgs.model_validate(arguments)
 
-        result = self.client.get_document(doc_id)
-        output = format_document(result, self.settings.max_document_length)
+        result = await self.client.get_document(args.doc_id, self._max_document_length)
+        output = format_document(result, self._max_document_length)
 
         return [TextContent(type="text", text=output)]
 
@@ -337,18 +577,10 @@ class ToolHandler:
         self, arguments: dict[str, Any]
     ) -> list[TextContent]:
         """Handle discover_documents tool call."""
-        query = arguments.get("query", "").strip()
-        if not query:
-            return ToolError("'query' parameter is required").to_content()
-
-        namespace = arguments.get("namespace")
-        # Validate namespace to prevent path traversal
-        if namespace and (".." in namespace or namespace.startswith("/")):
-            return ToolError("Invalid namespace format").to_content()
-
-        top_k = min(arguments.get("top_k", 10), 50)
+        args = _DiscoverDocumentsArgs.model_validate(arguments)
+        top_k = min(args.top_k, _DISCOVER_TOP_K_MAX)
 
-        result = self.client.discover_documents(query, namespace, top_k)
+        result = await self.client.discover_documents(args.query, args.namespace, top_k)
         output = format_discover_results(result)
 
         return [TextContent(type="text", text=output)]
@@ -1,15 +1,16 @@
 """Pytest configuration and fixtures for RAGBrain MCP tests."""
 
 import pytest
+import respx
 
 from ragbrain_mcp.client import RAGBrainClient
 from ragbrain_mcp.config import Settings
 from ragbrain_mcp.tools import ToolHandler
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def settings() -> Settings:
-    """Create test settings."""
+    """Create test settings, shared across the whole run (immutable)."""
     return Settings(
         url="http://localhost:8000",
         timeout=10.0,
@@ -19,18 +20,81 @@ def settings() -> Settings:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client(settings: Settings) -> RAGBrainClient:
-    """Create a test RAGBrain client."""
+    """Create a test RAGBrain client, shared across the whole run.
+
+    Constructing a client (and its pooled httpx client) per test adds up
+    over the suite; the instance is reused and its mutable state is
+    cleared between tests by `_reset_shared_state`.
+    """
     return RAGBrainClient(settings)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tool_handler(client: RAGBrainClient, settings: Settings) -> ToolHandler:
-    """Create a test tool handler."""
+    """Create a test tool handler, shared across the whole run."""
     return ToolHandler(client, settings)
 
 
+@pytest.fixture(autouse=True)
+def _reset_shared_state(client: RAGBrainClient, tool_handler: ToolHandler) -> None:
+    """Clear cached responses on the shared fixtures before each test."""
+    client.clear_cache()
+    tool_handler.clear_cache()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _respx_transport() -> None:
+    """Install the respx transport patch once for the whole run.
+
+    Patching httpx per test via the @respx.mock decorator rebuilds the
+    router and re-patches the transport every time; tests register
+    routes on the shared default router instead.
+    """
+    with respx.mock:
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _clear_respx_routes() -> None:
+    """Drop routes and call history left behind by the previous test."""
+    yield
+    respx.mock.clear()
+    respx.mock.reset()
+
+
+# Long strings for truncation tests, allocated once per session
+@pytest.fixture(scope="session")
+def long_text_2k() -> str:
+    """A 2,000-character string, just past the chunk truncation limit."""
+    return "x" * 2000
+
+
+@pytest.fixture(scope="session")
+def long_text_200k() -> str:
+    """A 200,000-character string, far past any document length cap."""
+    return "x" * 200000
+
+
+@pytest.fixture(scope="session")
+def long_doc(long_text_200k: str) -> dict:
+    """Sample document response with an oversized body."""
+    return {
+        "doc_id": "test-123",
+        "filename": "long.txt",
+        "namespace": "test",
+        "total_chunks": 100,
+        "reconstructed_text": long_text_200k,
+    }
+
+
+@pytest.fixture(scope="session")
+def results_base() -> dict:
+    """Envelope shared by search-result variants; overlay sources per test."""
+    return {"question": "test", "namespace": "default", "reranked": False}
+
+
 # Sample API responses for mocking
 @pytest.fixture
 def sample_namespaces() -> dict:
@@ -1,17 +1,32 @@
 """Tests for RAGBrain API client."""
 
+import asyncio
+import json
+
+import httpx
 import pytest
 import respx
 from httpx import Response
 
-from ragbrain_mcp.client import RAGBrainClient
+from ragbrain_mcp.client import RAGBrainClient, _TTLCache
 from ragbrain_mcp.config import Settings
 
+# Mocked API endpoints, built once for every route registration
+BASE_URL = "http://test-api:8000"
+HEALTH_URL = BASE_URL + "/health"
+NAMESPACES_URL = BASE_URL + "/api/namespaces"
+NAMESPACES_TREE_URL = NAMESPACES_URL + "/tree"
+DOCS_URL = BASE_URL + "/api/documents"
+DOCS_BULK_URL = DOCS_URL + "/bulk"
+DISCOVER_URL = DOCS_URL + "/discover"
+QUERY_URL = BASE_URL + "/api/query"
+DOC_BY_ID = DOCS_URL + "/id/{}"
+
 
 @pytest.fixture
 def mock_client() -> RAGBrainClient:
     """Create a client for testing with mocked HTTP."""
-    settings = Settings(url="http://test-api:8000", timeout=5.0)
+    settings = Settings(url=BASE_URL, timeout=5.0)
     return RAGBrainClient(settings)
 
 
@@ -31,125 +46,308 @@ class TestRAGBrainClient:
         _ = client.client  # Access the property
         assert client._client is not None
 
-    def test_close(self, settings: Settings) -> None:
-        """Test client close method."""
+    @pytest.mark.asyncio
+    async def test_aclose(self, settings: Settings) -> None:
+        """Test client aclose method."""
         client = RAGBrainClient(settings)
         _ = client.client  # Initialize the client
-        client.close()
+        await client.aclose()
         assert client._client is None
 
-    @respx.mock
-    def test_health_check(self, mock_client: RAGBrainClient) -> None:
+    @pytest.mark.asyncio
+    async def test_health_check(self, mock_client: RAGBrainClient) -> None:
         """Test health check request."""
-        respx.get("http://test-api:8000/health").mock(
+        respx.get(HEALTH_URL).mock(
             return_value=Response(200, json={"status": "healthy"})
         )
 
-        result = mock_client.health_check()
+        result = await mock_client.health_check()
         assert result["status"] == "healthy"
 
-    @respx.mock
-    def test_list_namespaces(
+    @pytest.mark.asyncio
+    async def test_list_namespaces(
         self, mock_client: RAGBrainClient, sample_namespaces: dict
     ) -> None:
         """Test list namespaces request."""
-        respx.get("http://test-api:8000/api/namespaces").mock(
+        respx.get(NAMESPACES_URL).mock(
             return_value=Response(200, json=sample_namespaces)
         )
 
-        result = mock_client.list_namespaces()
+        result = await mock_client.list_namespaces()
         assert "namespaces" in result
         assert len(result["namespaces"]) == 2
 
-    @respx.mock
-    def test_get_namespace_tree(
+    @pytest.mark.asyncio
+    async def test_get_namespace_tree(
         self, mock_client: RAGBrainClient, sample_namespace_tree: dict
     ) -> None:
         """Test get namespace tree request."""
-        respx.get("http://test-api:8000/api/namespaces/tree").mock(
+        respx.get(NAMESPACES_TREE_URL).mock(
             return_value=Response(200, json=sample_namespace_tree)
         )
 
-        result = mock_client.get_namespace_tree()
+        result = await mock_client.get_namespace_tree()
         assert "tree" in result
 
-    @respx.mock
-    def test_browse_namespace(
+    @pytest.mark.asyncio
+    async def test_browse_namespace(
         self, mock_client: RAGBrainClient, sample_documents: dict
     ) -> None:
         """Test browse namespace request."""
-        respx.get("http://test-api:8000/api/documents").mock(
+        route = respx.get(DOCS_URL).mock(
             return_value=Response(200, json=sample_documents)
         )
 
-        result = mock_client.browse_namespace("personal", limit=50)
+        result = await mock_client.browse_namespace("personal", limit=50)
         assert result["namespace"] == "personal"
         assert len(result["documents"]) == 2
+        # The limit is pushed to the API instead of sliced client-side
+        assert route.calls.last.request.url.params["limit"] == "50"
 
-    @respx.mock
-    def test_search(
+    @pytest.mark.asyncio
+    async def test_search(
         self, mock_client: RAGBrainClient, sample_search_results: dict
     ) -> None:
         """Test search request."""
-        respx.post("http://test-api:8000/api/query").mock(
+        respx.post(QUERY_URL).mock(
             return_value=Response(200, json=sample_search_results)
         )
 
-        result = mock_client.search("machine learning", top_k=5)
+        result = await mock_client.search("machine learning", top_k=5)
         assert "sources" in result
         assert len(result["sources"]) == 2
 
-    @respx.mock
-    def test_search_with_namespace(
+    @pytest.mark.asyncio
+    async def test_search_with_namespace(
         self, mock_client: RAGBrainClient, sample_search_results: dict
     ) -> None:
         """Test search request with namespace filter."""
-        route = respx.post("http://test-api:8000/api/query").mock(
+        route = respx.post(QUERY_URL).mock(
             return_value=Response(200, json=sample_search_results)
         )
 
-        mock_client.search("test query", namespace="personal", top_k=3)
+        await mock_client.search("test query", namespace="personal", top_k=3)
 
         # Verify request body
         request = route.calls.last.request
-        import json
         body = json.loads(request.content)
         assert body["query"] == "test query"
         assert body["namespace"] == "personal"
         assert body["top_k"] == 3
 
-    @respx.mock
-    def test_get_document(
+    @pytest.mark.asyncio
+    async def test_get_document(
         self, mock_client: RAGBrainClient, sample_document: dict
     ) -> None:
         """Test get document request."""
-        respx.get("http://test-api:8000/api/documents/id/abc-123").mock(
+        respx.get(DOC_BY_ID.format("abc-123")).mock(
             return_value=Response(200, json=sample_document)
         )
 
-        result = mock_client.get_document("abc-123")
+        result = await mock_client.get_document("abc-123")
         assert result["doc_id"] == "abc-123"
         assert result["filename"] == "notes.md"
 
-    @respx.mock
-    def test_http_error_handling(self, mock_client: RAGBrainClient) -> None:
+    @pytest.mark.asyncio
+    async def test_get_document_max_length(
+        self, mock_client: RAGBrainClient, sample_document: dict
+    ) -> None:
+        """Test get document passes max_chars to the API."""
+        route = respx.get(DOC_BY_ID.format("abc-123")).mock(
+            return_value=Response(200, json=sample_document)
+        )
+
+        await mock_client.get_document("abc-123", max_length=5000)
+        assert route.calls.last.request.url.params["max_chars"] == "5000"
+
+    @pytest.mark.asyncio
+    async def test_list_namespaces_cached(
+        self, mock_client: RAGBrainClient, sample_namespaces: dict
+    ) -> None:
+        """Test repeated namespace listings are served from cache."""
+        route = respx.get(NAMESPACES_URL).mock(
+            return_value=Response(200, json=sample_namespaces)
+        )
+
+        first = await mock_client.list_namespaces()
+        second = await mock_client.list_namespaces()
+        assert route.call_count == 1
+        assert first == second
+
+    @pytest.mark.asyncio
+    async def test_clear_cache(
+        self, mock_client: RAGBrainClient, sample_namespaces: dict
+    ) -> None:
+        """Test clear_cache forces a refetch."""
+        route = respx.get(NAMESPACES_URL).mock(
+            return_value=Response(200, json=sample_namespaces)
+        )
+
+        await mock_client.list_namespaces()
+        mock_client.clear_cache()
+        await mock_client.list_namespaces()
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_namespace_etag_revalidation(
+        self, mock_client: RAGBrainClient, sample_namespaces: dict
+    ) -> None:
+        """Test a 304 revalidation reuses the previously fetched body."""
+
+        def respond(request):
+            if request.headers.get("If-None-Match") == '"abc123"':
+                return Response(304)
+            return Response(
+                200, json=sample_namespaces, headers={"ETag": '"abc123"'}
+            )
+
+        route = respx.get(NAMESPACES_URL).mock(
+            side_effect=respond
+        )
+
+        first = await mock_client.list_namespaces()
+        mock_client.clear_cache()  # Expire the TTL cache, keep the ETag
+        second = await mock_client.list_namespaces()
+        assert route.call_count == 2
+        assert second == first
+
+    @pytest.mark.asyncio
+    async def test_concurrent_gets_are_coalesced(
+        self, mock_client: RAGBrainClient, sample_namespaces: dict
+    ) -> None:
+        """Test concurrent identical GETs share one HTTP request."""
+
+        async def slow_response(request) -> Response:
+            # Yield control so both calls are in flight at once
+            await asyncio.sleep(0)
+            return Response(200, json=sample_namespaces)
+
+        route = respx.get(NAMESPACES_URL).mock(
+            side_effect=slow_response
+        )
+
+        results = await asyncio.gather(
+            mock_client.list_namespaces(),
+            mock_client.list_namespaces(),
+        )
+        assert route.call_count == 1
+        assert results[0] == results[1]
+
+    @pytest.mark.asyncio
+    async def test_get_documents_bulk(
+        self, mock_client: RAGBrainClient, sample_document: dict
+    ) -> None:
+        """Test bulk document fetch uses the batch endpoint."""
+        respx.post(DOCS_BULK_URL).mock(
+            return_value=Response(200, json={"documents": [sample_document]})
+        )
+
+        result = await mock_client.get_documents_bulk(["abc-123"])
+        assert len(result) == 1
+        assert result[0]["doc_id"] == "abc-123"
+
+    @pytest.mark.asyncio
+    async def test_get_documents_bulk_fallback(
+        self, mock_client: RAGBrainClient, sample_document: dict
+    ) -> None:
+        """Test bulk fetch falls back to per-document requests on 404."""
+        respx.post(DOCS_BULK_URL).mock(
+            return_value=Response(404, json={"detail": "Not found"})
+        )
+        respx.get(DOC_BY_ID.format("abc-123")).mock(
+            return_value=Response(200, json=sample_document)
+        )
+
+        result = await mock_client.get_documents_bulk(["abc-123"])
+        assert len(result) == 1
+        assert result[0]["doc_id"] == "abc-123"
+
+    @pytest.mark.asyncio
+    async def test_get_documents_bulk_empty(self, mock_client: RAGBrainClient) -> None:
+        """Test bulk fetch with no IDs makes no request."""
+        result = await mock_client.get_documents_bulk([])
+        assert result == []
+
+    @pytest.mark.asyncio
+    async def test_discover_and_fetch(
+        self, mock_client: RAGBrainClient, sample_document: dict
+    ) -> None:
+        """Test discover_and_fetch pipelines discovery into parallel fetches."""
+        respx.get(DISCOVER_URL).mock(
+            return_value=Response(
+                200,
+                json={
+                    "query": "notes",
+                    "count": 2,
+                    "documents": [
+                        {"doc_id": "abc-123", "filename": "notes.md"},
+                        {"doc_id": "def-456", "filename": "guide.pdf"},
+                    ],
+                },
+            )
+        )
+        respx.get(DOC_BY_ID.format("abc-123")).mock(
+            return_value=Response(200, json=sample_document)
+        )
+        respx.get(DOC_BY_ID.format("def-456")).mock(
+            return_value=Response(200, json={**sample_document, "doc_id": "def-456"})
+        )
+
+        result = await mock_client.discover_and_fetch("notes", top_k=2)
+        assert [doc["doc_id"] for doc in result] == ["abc-123", "def-456"]
+
+    @pytest.mark.asyncio
+    async def test_discover_and_fetch_no_matches(
+        self, mock_client: RAGBrainClient
+    ) -> None:
+        """Test discover_and_fetch with no discovered documents."""
+        respx.get(DISCOVER_URL).mock(
+            return_value=Response(200, json={"query": "nothing", "count": 0, "documents": []})
+        )
+
+        result = await mock_client.discover_and_fetch("nothing")
+        assert result == []
+
+    @pytest.mark.asyncio
+    async def test_http_error_handling(self, mock_client: RAGBrainClient) -> None:
         """Test HTTP error is raised properly."""
-        respx.get("http://test-api:8000/health").mock(
+        respx.get(HEALTH_URL).mock(
             return_value=Response(500, json={"error": "Internal error"})
         )
 
-        import httpx
         with pytest.raises(httpx.HTTPStatusError):
-            mock_client.health_check()
+            await mock_client.health_check()
 
-    @respx.mock
-    def test_404_error(self, mock_client: RAGBrainClient) -> None:
+    @pytest.mark.asyncio
+    async def test_404_error(self, mock_client: RAGBrainClient) -> None:
         """Test 404 error handling."""
-        respx.get("http://test-api:8000/api/documents/id/not-found").mock(
+        respx.get(DOC_BY_ID.format("not-found")).mock(
             return_value=Response(404, json={"detail": "Document not found"})
         )
 
-        import httpx
         with pytest.raises(httpx.HTTPStatusError) as exc_info:
-            mock_client.get_document("not-found")
+            await mock_client.get_document("not-found")
         assert exc_info.value.response.status_code == 404
+
+
+class TestTTLCache:
+    """Tests for the _TTLCache helper."""
+
+    def test_evicts_oldest_when_full(self) -> None:
+        """Test the cache stays within maxsize by dropping the oldest entry."""
+        cache = _TTLCache(ttl=60.0, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    def test_resetting_a_key_does_not_evict(self) -> None:
+        """Test overwriting an existing key doesn't push out another entry."""
+        cache = _TTLCache(ttl=60.0, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 10)
+        assert cache.get("a") == 10
+        assert cache.get("b") == 2
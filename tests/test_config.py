@@ -18,6 +18,7 @@ class TestSettings:
         assert settings.log_level == "INFO"
         assert settings.max_results == 20
         assert settings.max_document_length == 100000
+        assert settings.cache_ttl_seconds == 30.0
 
     def test_custom_settings(self) -> None:
         """Test custom settings values."""
@@ -52,6 +53,13 @@ class TestSettings:
         settings = Settings(log_level="debug")
         assert settings.log_level == "DEBUG"
 
+    def test_log_level_int(self) -> None:
+        """Test numeric log level is derived from the name."""
+        import logging
+
+        settings = Settings(log_level="warning")
+        assert settings.log_level_int == logging.WARNING
+
     def test_log_level_invalid(self) -> None:
         """Test that invalid log level raises error."""
         with pytest.raises(ValueError, match="Invalid log level"):
@@ -90,3 +98,7 @@ class TestGetSettings:
         """Test that get_settings returns a Settings instance."""
         settings = get_settings()
         assert isinstance(settings, Settings)
+
+    def test_returns_cached_instance(self) -> None:
+        """Test that get_settings memoizes the instance."""
+        assert get_settings() is get_settings()
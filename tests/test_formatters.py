@@ -111,24 +111,21 @@ class TestFormatSearchResults:
         assert "Result 1" in result
         assert "ai-intro.md" in result
 
-    def test_truncates_long_text(self) -> None:
+    def test_truncates_long_text(self, results_base: dict, long_text_2k: str) -> None:
         """Test that long text is truncated."""
-        long_text = "x" * 2000
         results = {
-            "question": "test",
+            **results_base,
             "sources": [
                 {
-                    "content": long_text,
+                    "content": long_text_2k,
                     "score": 0.9,
                     "metadata": {"filename": "test.txt", "namespace": "test"},
                 }
             ],
-            "namespace": "default",
-            "reranked": False,
         }
         result = format_search_results(results)
         assert "..." in result
-        assert len(result) < len(long_text) + 500  # Some overhead for formatting
+        assert len(result) < len(long_text_2k) + 500  # Some overhead for formatting
 
 
 class TestFormatDocumentList:
@@ -162,15 +159,14 @@ class TestFormatDocument:
         assert "Chunks:** 5" in result
         assert "My Notes" in result
 
-    def test_truncates_long_document(self) -> None:
+    def test_truncates_long_document(self, long_doc: dict) -> None:
         """Test that long documents are truncated."""
-        doc = {
-            "doc_id": "test-123",
-            "filename": "long.txt",
-            "namespace": "test",
-            "total_chunks": 100,
-            "reconstructed_text": "x" * 200000,
-        }
-        result = format_document(doc, max_length=1000)
+        result = format_document(long_doc, max_length=1000)
         assert "[Document truncated" in result
         assert len(result) < 2000
+
+    def test_server_truncated_flag(self, sample_document: dict) -> None:
+        """Test that the server's truncated flag is honored."""
+        doc = {**sample_document, "truncated": True}
+        result = format_document(doc)
+        assert "[Document truncated" in result
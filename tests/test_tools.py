@@ -1,9 +1,15 @@
 """Tests for MCP tool definitions and handlers."""
 
+import asyncio
+
+import httpx
+import orjson
 import pytest
 import respx
 from httpx import Response
 
+from ragbrain_mcp.client import RAGBrainClient
+from ragbrain_mcp.config import Settings
 from ragbrain_mcp.tools import (
     TOOL_BROWSE_NAMESPACE,
     TOOL_DISCOVER_DOCUMENTS,
@@ -12,23 +18,34 @@ from ragbrain_mcp.tools import (
     TOOL_SEARCH,
     ToolHandler,
     get_tool_definitions,
+    get_tool_definitions_json,
 )
-from ragbrain_mcp.client import RAGBrainClient
-from ragbrain_mcp.config import Settings
+
+# Mocked API endpoints, built once for every route registration
+BASE_URL = "http://test-api:8000"
+NAMESPACES_URL = BASE_URL + "/api/namespaces"
+NAMESPACES_TREE_URL = NAMESPACES_URL + "/tree"
+DOCS_URL = BASE_URL + "/api/documents"
+QUERY_URL = BASE_URL + "/api/query"
+DOC_BY_ID = DOCS_URL + "/id/{}"
+
+
+@pytest.fixture(scope="module")
+def tool_defs() -> list:
+    """Fetch the tool definitions once for the whole module."""
+    return get_tool_definitions()
 
 
 class TestToolDefinitions:
     """Tests for tool definitions."""
 
-    def test_get_tool_definitions_count(self) -> None:
+    def test_get_tool_definitions_count(self, tool_defs: list) -> None:
         """Test that all tools are defined."""
-        tools = get_tool_definitions()
-        assert len(tools) == 5
+        assert len(tool_defs) == 5
 
-    def test_tool_names(self) -> None:
+    def test_tool_names(self, tool_defs: list) -> None:
         """Test tool names are correct."""
-        tools = get_tool_definitions()
-        names = {t.name for t in tools}
+        names = {t.name for t in tool_defs}
         assert names == {
             TOOL_LIST_NAMESPACES,
             TOOL_SEARCH,
@@ -37,55 +54,71 @@ class TestToolDefinitions:
             TOOL_DISCOVER_DOCUMENTS,
         }
 
-    def test_all_tools_have_descriptions(self) -> None:
+    def test_all_tools_have_descriptions(self, tool_defs: list) -> None:
         """Test all tools have descriptions."""
-        tools = get_tool_definitions()
-        for tool in tools:
+        for tool in tool_defs:
             assert tool.description
             assert len(tool.description) > 20
 
-    def test_all_tools_have_schemas(self) -> None:
+    def test_all_tools_have_schemas(self, tool_defs: list) -> None:
         """Test all tools have input schemas."""
-        tools = get_tool_definitions()
-        for tool in tools:
+        for tool in tool_defs:
             assert tool.inputSchema
             assert tool.inputSchema["type"] == "object"
             assert "properties" in tool.inputSchema
 
-    def test_search_tool_schema(self) -> None:
+    def test_search_tool_schema(self, tool_defs: list) -> None:
         """Test search tool has correct schema."""
-        tools = get_tool_definitions()
-        search_tool = next(t for t in tools if t.name == TOOL_SEARCH)
+        search_tool = next(t for t in tool_defs if t.name == TOOL_SEARCH)
         schema = search_tool.inputSchema
         assert "query" in schema["properties"]
         assert schema["required"] == ["query"]
         assert schema["properties"]["query"]["minLength"] == 1
         assert schema["properties"]["top_k"]["maximum"] == 20
 
+    def test_serialized_definitions_match(self, tool_defs: list) -> None:
+        """Test the pre-serialized JSON stays in sync with the Tool objects."""
+        decoded = orjson.loads(get_tool_definitions_json())
+        assert len(decoded) == len(tool_defs)
+        for raw, tool in zip(decoded, tool_defs, strict=True):
+            assert raw["name"] == tool.name
+            assert raw["description"] == tool.description
+            assert raw["inputSchema"] == tool.inputSchema
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def mock_settings() -> Settings:
-    """Create settings for mocked testing."""
-    return Settings(url="http://test-api:8000", timeout=5.0)
+    """Create settings for mocked testing, shared across the whole run."""
+    return Settings(url=BASE_URL, timeout=5.0)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_handler(mock_settings: Settings) -> ToolHandler:
-    """Create a tool handler with mocked client."""
+    """Create a tool handler with mocked client, shared across this module.
+
+    respx intercepts at the transport layer, so tests don't need a fresh
+    client each; `_reset_mock_handler` clears cached results between tests.
+    """
     client = RAGBrainClient(mock_settings)
     return ToolHandler(client, mock_settings)
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_handler(mock_handler: ToolHandler) -> None:
+    """Clear cached results on the shared handler before each test."""
+    mock_handler.clear_cache()
+    mock_handler.client.clear_cache()
+
+
 class TestToolHandler:
     """Tests for ToolHandler class."""
 
-    @respx.mock
     @pytest.mark.asyncio
     async def test_list_namespaces(
         self, mock_handler: ToolHandler, sample_namespaces: dict
     ) -> None:
         """Test list_namespaces tool."""
-        respx.get("http://test-api:8000/api/namespaces").mock(
+        respx.get(NAMESPACES_URL).mock(
             return_value=Response(200, json=sample_namespaces)
         )
 
@@ -94,26 +127,24 @@ class TestToolHandler:
         assert "Personal" in result[0].text
         assert "Work" in result[0].text
 
-    @respx.mock
     @pytest.mark.asyncio
     async def test_list_namespaces_tree_view(
         self, mock_handler: ToolHandler, sample_namespace_tree: dict
     ) -> None:
         """Test list_namespaces with tree view."""
-        respx.get("http://test-api:8000/api/namespaces/tree").mock(
+        respx.get(NAMESPACES_TREE_URL).mock(
             return_value=Response(200, json=sample_namespace_tree)
         )
 
         result = await mock_handler.handle(TOOL_LIST_NAMESPACES, {"tree_view": True})
         assert "Namespace Tree" in result[0].text
 
-    @respx.mock
     @pytest.mark.asyncio
     async def test_search(
         self, mock_handler: ToolHandler, sample_search_results: dict
     ) -> None:
         """Test search tool."""
-        respx.post("http://test-api:8000/api/query").mock(
+        respx.post(QUERY_URL).mock(
             return_value=Response(200, json=sample_search_results)
         )
 
@@ -122,12 +153,22 @@ class TestToolHandler:
         assert "Search Results" in result[0].text
         assert "ml-notes.md" in result[0].text
 
+    @pytest.mark.parametrize(
+        ("tool", "field"),
+        [
+            (TOOL_SEARCH, "query"),
+            (TOOL_BROWSE_NAMESPACE, "namespace"),
+            (TOOL_GET_DOCUMENT, "doc_id"),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_search_missing_query(self, mock_handler: ToolHandler) -> None:
-        """Test search tool with missing query."""
-        result = await mock_handler.handle(TOOL_SEARCH, {})
+    async def test_missing_required_argument(
+        self, mock_handler: ToolHandler, tool: str, field: str
+    ) -> None:
+        """Test tools report their missing required argument."""
+        result = await mock_handler.handle(tool, {})
         assert "Error" in result[0].text
-        assert "query" in result[0].text
+        assert field in result[0].text
 
     @pytest.mark.asyncio
     async def test_search_empty_query(self, mock_handler: ToolHandler) -> None:
@@ -135,13 +176,18 @@ class TestToolHandler:
         result = await mock_handler.handle(TOOL_SEARCH, {"query": "  "})
         assert "Error" in result[0].text
 
-    @respx.mock
+    @pytest.mark.asyncio
+    async def test_unhashable_argument_values(self, mock_handler: ToolHandler) -> None:
+        """Test list-valued arguments return error content instead of raising."""
+        result = await mock_handler.handle(TOOL_SEARCH, {"query": ["x"]})
+        assert "Error" in result[0].text
+
     @pytest.mark.asyncio
     async def test_browse_namespace(
         self, mock_handler: ToolHandler, sample_documents: dict
     ) -> None:
         """Test browse_namespace tool."""
-        respx.get("http://test-api:8000/api/documents").mock(
+        respx.get(DOCS_URL).mock(
             return_value=Response(200, json=sample_documents)
         )
 
@@ -151,20 +197,12 @@ class TestToolHandler:
         assert "Documents in" in result[0].text
         assert "notes.md" in result[0].text
 
-    @pytest.mark.asyncio
-    async def test_browse_namespace_missing(self, mock_handler: ToolHandler) -> None:
-        """Test browse_namespace with missing namespace."""
-        result = await mock_handler.handle(TOOL_BROWSE_NAMESPACE, {})
-        assert "Error" in result[0].text
-        assert "namespace" in result[0].text
-
-    @respx.mock
     @pytest.mark.asyncio
     async def test_get_document(
         self, mock_handler: ToolHandler, sample_document: dict
     ) -> None:
         """Test get_document tool."""
-        respx.get("http://test-api:8000/api/documents/id/abc-123").mock(
+        respx.get(DOC_BY_ID.format("abc-123")).mock(
             return_value=Response(200, json=sample_document)
         )
 
@@ -173,11 +211,79 @@ class TestToolHandler:
         assert "My Notes" in result[0].text
 
     @pytest.mark.asyncio
-    async def test_get_document_missing_id(self, mock_handler: ToolHandler) -> None:
-        """Test get_document with missing doc_id."""
-        result = await mock_handler.handle(TOOL_GET_DOCUMENT, {})
-        assert "Error" in result[0].text
-        assert "doc_id" in result[0].text
+    async def test_repeated_call_served_from_cache(
+        self, mock_handler: ToolHandler, sample_document: dict
+    ) -> None:
+        """Test identical tool calls reuse the cached result."""
+        route = respx.get(DOC_BY_ID.format("abc-123")).mock(
+            return_value=Response(200, json=sample_document)
+        )
+
+        first = await mock_handler.handle(TOOL_GET_DOCUMENT, {"doc_id": "abc-123"})
+        second = await mock_handler.handle(TOOL_GET_DOCUMENT, {"doc_id": "abc-123"})
+        assert route.call_count == 1
+        assert first[0].text == second[0].text
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_coalesced(
+        self, mock_handler: ToolHandler, sample_search_results: dict
+    ) -> None:
+        """Test concurrent identical tool calls share one backend request."""
+
+        async def slow_response(request) -> Response:
+            # Yield control so both calls are in flight at once
+            await asyncio.sleep(0)
+            return Response(200, json=sample_search_results)
+
+        route = respx.post(QUERY_URL).mock(
+            side_effect=slow_response
+        )
+
+        results = await asyncio.gather(
+            mock_handler.handle(TOOL_SEARCH, {"query": "machine learning"}),
+            mock_handler.handle(TOOL_SEARCH, {"query": "machine learning"}),
+        )
+        assert route.call_count == 1
+        assert results[0][0].text == results[1][0].text
+
+    @pytest.mark.asyncio
+    async def test_clear_cache_forces_refetch(
+        self, mock_handler: ToolHandler, sample_document: dict
+    ) -> None:
+        """Test clear_cache drops cached tool results."""
+        route = respx.get(DOC_BY_ID.format("abc-123")).mock(
+            return_value=Response(200, json=sample_document)
+        )
+
+        await mock_handler.handle(TOOL_GET_DOCUMENT, {"doc_id": "abc-123"})
+        mock_handler.clear_cache()
+        await mock_handler.handle(TOOL_GET_DOCUMENT, {"doc_id": "abc-123"})
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_handle_many(
+        self,
+        mock_handler: ToolHandler,
+        sample_namespaces: dict,
+        sample_search_results: dict,
+    ) -> None:
+        """Test handle_many runs a batch of calls and preserves order."""
+        respx.get(NAMESPACES_URL).mock(
+            return_value=Response(200, json=sample_namespaces)
+        )
+        respx.post(QUERY_URL).mock(
+            return_value=Response(200, json=sample_search_results)
+        )
+
+        results = await mock_handler.handle_many(
+            [
+                (TOOL_LIST_NAMESPACES, {}),
+                (TOOL_SEARCH, {"query": "machine learning"}),
+            ]
+        )
+        assert len(results) == 2
+        assert "Personal" in results[0][0].text
+        assert "Search Results" in results[1][0].text
 
     @pytest.mark.asyncio
     async def test_unknown_tool(self, mock_handler: ToolHandler) -> None:
@@ -186,12 +292,10 @@ class TestToolHandler:
         assert "Error" in result[0].text
         assert "Unknown tool" in result[0].text
 
-    @respx.mock
     @pytest.mark.asyncio
     async def test_connection_error(self, mock_handler: ToolHandler) -> None:
         """Test connection error handling."""
-        import httpx
-        respx.get("http://test-api:8000/api/namespaces").mock(
+        respx.get(NAMESPACES_URL).mock(
             side_effect=httpx.ConnectError("Connection refused")
         )
 
@@ -199,11 +303,10 @@ class TestToolHandler:
         assert "Error" in result[0].text
         assert "Cannot connect" in result[0].text
 
-    @respx.mock
     @pytest.mark.asyncio
     async def test_404_error(self, mock_handler: ToolHandler) -> None:
         """Test 404 error handling."""
-        respx.get("http://test-api:8000/api/documents/id/missing").mock(
+        respx.get(DOC_BY_ID.format("missing")).mock(
             return_value=Response(404, text="Document not found")
         )
 
@@ -211,12 +314,10 @@ class TestToolHandler:
         assert "Error" in result[0].text
         assert "Not found" in result[0].text
 
-    @respx.mock
     @pytest.mark.asyncio
     async def test_timeout_error(self, mock_handler: ToolHandler) -> None:
         """Test timeout error handling."""
-        import httpx
-        respx.get("http://test-api:8000/api/namespaces").mock(
+        respx.get(NAMESPACES_URL).mock(
             side_effect=httpx.TimeoutException("Request timed out")
         )
 
@@ -224,30 +325,22 @@ class TestToolHandler:
         assert "Error" in result[0].text
         assert "timed out" in result[0].text
 
+    @pytest.mark.parametrize(
+        ("tool", "bad_namespace"),
+        [
+            (TOOL_SEARCH, "../etc"),
+            (TOOL_SEARCH, "/etc/passwd"),
+            (TOOL_SEARCH, "work\\secrets"),
+            (TOOL_BROWSE_NAMESPACE, "../secrets"),
+            (TOOL_BROWSE_NAMESPACE, "/root"),
+        ],
+    )
     @pytest.mark.asyncio
-    async def test_search_namespace_path_traversal(self, mock_handler: ToolHandler) -> None:
-        """Test that path traversal in namespace is rejected."""
-        result = await mock_handler.handle(TOOL_SEARCH, {"query": "test", "namespace": "../etc"})
-        assert "Error" in result[0].text
-        assert "Invalid namespace" in result[0].text
-
-    @pytest.mark.asyncio
-    async def test_search_namespace_absolute_path(self, mock_handler: ToolHandler) -> None:
-        """Test that absolute path in namespace is rejected."""
-        result = await mock_handler.handle(TOOL_SEARCH, {"query": "test", "namespace": "/etc/passwd"})
-        assert "Error" in result[0].text
-        assert "Invalid namespace" in result[0].text
-
-    @pytest.mark.asyncio
-    async def test_browse_namespace_path_traversal(self, mock_handler: ToolHandler) -> None:
-        """Test that path traversal in browse namespace is rejected."""
-        result = await mock_handler.handle(TOOL_BROWSE_NAMESPACE, {"namespace": "../secrets"})
-        assert "Error" in result[0].text
-        assert "Invalid namespace" in result[0].text
-
-    @pytest.mark.asyncio
-    async def test_browse_namespace_absolute_path(self, mock_handler: ToolHandler) -> None:
-        """Test that absolute path in browse namespace is rejected."""
-        result = await mock_handler.handle(TOOL_BROWSE_NAMESPACE, {"namespace": "/root"})
+    async def test_unsafe_namespace_rejected(
+        self, mock_handler: ToolHandler, tool: str, bad_namespace: str
+    ) -> None:
+        """Test that unsafe namespace strings are rejected across tools."""
+        arguments = {"query": "test", "namespace": bad_namespace}
+        result = await mock_handler.handle(tool, arguments)
         assert "Error" in result[0].text
         assert "Invalid namespace" in result[0].text